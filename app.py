@@ -56,18 +56,21 @@ if not tavily_api_key:
 
 # 3. Define the Tools
 # Tavily will search the web for us. We set k=5 to get top 5 results per query.
-search_tool = TavilySearchResults(tavily_api_key=tavily_api_key, k=5)
-tools = [search_tool]
+@st.cache_resource(show_spinner=False)
+def build_search_tool(api_key):
+    return TavilySearchResults(tavily_api_key=api_key, k=5)
 
 # 4. Define the "Brain" (LLM) - Switch based on provider
-if model_provider == "OpenAI":
-    from langchain_openai import ChatOpenAI
-    llm = ChatOpenAI(model="gpt-4o", temperature=0, api_key=openai_api_key)
-else:  # Ollama
+@st.cache_resource(show_spinner=False)
+def build_llm(provider, api_key=None, model=None, base_url=None):
+    if provider == "OpenAI":
+        from langchain_openai import ChatOpenAI
+        return ChatOpenAI(model="gpt-4o", temperature=0, api_key=api_key)
+    # Ollama
     from langchain_ollama import ChatOllama
-    llm = ChatOllama(
-        model=ollama_model,
-        base_url=ollama_base_url,
+    return ChatOllama(
+        model=model,
+        base_url=base_url,
         temperature=0
     )
 
@@ -85,7 +88,46 @@ If you cannot find specific data, state "Data not publicly available" rather tha
 Format your output as a clean Markdown report."""
 
 # 6. Construct the Agent
-agent = create_agent(llm, tools, system_prompt=system_prompt)
+# Streamlit reruns this script on every widget interaction, so the tool, LLM and
+# agent are cached per provider/credentials instead of being rebuilt each time.
+@st.cache_resource(show_spinner=False)
+def build_agent(provider, tavily_key, openai_key=None, model=None, base_url=None):
+    tools = [build_search_tool(tavily_key)]
+    llm = build_llm(provider, api_key=openai_key, model=model, base_url=base_url)
+    return create_agent(llm, tools, system_prompt=system_prompt)
+
+if model_provider == "OpenAI":
+    model_name = "gpt-4o"
+    base_url = None
+    agent = build_agent(model_provider, tavily_api_key, openai_key=openai_api_key)
+else:  # Ollama
+    model_name = ollama_model
+    base_url = ollama_base_url
+    agent = build_agent(model_provider, tavily_api_key, model=ollama_model, base_url=ollama_base_url)
+
+# Each report costs several search + LLM calls, so results are cached for a day
+# per (provider, model, server, firm). The agent and the firm name as typed are
+# excluded from the cache key; firm_key is the normalised name.
+@st.cache_data(ttl=24 * 3600, show_spinner=False)
+def run_due_diligence(_agent, provider, model, base_url, firm_key, _firm_name):
+    # Run the agent
+    response = _agent.invoke({"messages": [HumanMessage(content=f"Research the firm: {_firm_name}")]})
+    
+    # Extract the final message from the response
+    # The response contains messages, get the last AI message
+    messages = response.get("messages", [])
+    output = ""
+    for msg in reversed(messages):
+        if isinstance(msg, AIMessage) and msg.content:
+            output = msg.content
+            break
+        elif hasattr(msg, 'content') and msg.content:
+            output = msg.content
+            break
+        elif isinstance(msg, dict) and 'content' in msg:
+            output = msg['content']
+            break
+    return output if output else str(response)
 
 # 7. The UI Logic
 firm_name = st.text_input("Enter Investment Firm Name (e.g. 'Sequoia Capital'):")
@@ -93,28 +135,14 @@ firm_name = st.text_input("Enter Investment Firm Name (e.g. 'Sequoia Capital'):"
 if st.button("Generate Due Diligence Report") and firm_name:
     with st.spinner(f"Agent is researching {firm_name} across the web..."):
         try:
-            # Run the agent
-            response = agent.invoke({"messages": [HumanMessage(content=f"Research the firm: {firm_name}")]})
-            
-            # Extract the final message from the response
-            # The response contains messages, get the last AI message
-            messages = response.get("messages", [])
-            output = ""
-            for msg in reversed(messages):
-                if isinstance(msg, AIMessage) and msg.content:
-                    output = msg.content
-                    break
-                elif hasattr(msg, 'content') and msg.content:
-                    output = msg.content
-                    break
-                elif isinstance(msg, dict) and 'content' in msg:
-                    output = msg['content']
-                    break
+            output = run_due_diligence(
+                agent, model_provider, model_name, base_url, firm_name.strip().lower(), firm_name.strip()
+            )
             
             # Display Result
             st.success("Research Complete!")
             st.markdown("---")
-            st.markdown(output if output else str(response))
+            st.markdown(output)
             
         except Exception as e:
-            st.error(f"An error occurred: {e}")
\ No newline at end of file
+            st.error(f"An error occurred: {e}")
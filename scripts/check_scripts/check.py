@@ -0,0 +1,59 @@
+"""Run one or all of the environment check scripts in a single interpreter.
+
+Running the checks through this entry point pays Python startup once instead of
+once per script.
+
+Usage:
+    python scripts/check_scripts/check.py                  # all checks
+    python scripts/check_scripts/check.py --mode streamlit
+"""
+import argparse
+import runpy
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Mode name -> check script it runs
+CHECK_SCRIPTS = {
+    "env": "check_env.py",
+    "streamlit": "check_streamlit_env.py",
+    "langchain": "check_langchain_version.py",
+}
+
+
+def run_check(mode):
+    """Run a single check script as if it were invoked directly.
+
+    Returns the script's exit code (0 if it did not call sys.exit).
+    """
+    try:
+        runpy.run_path(str(SCRIPT_DIR / CHECK_SCRIPTS[mode]), run_name="__main__")
+    except SystemExit as e:
+        # sys.exit() with no argument is success; a message string is a failure
+        return 0 if e.code is None else (e.code if isinstance(e.code, int) else 1)
+    return 0
+
+
+def main():
+    """Parse the requested mode and run the matching checks."""
+    parser = argparse.ArgumentParser(description="Run environment checks.")
+    parser.add_argument(
+        "--mode",
+        choices=[*CHECK_SCRIPTS, "all"],
+        default="all",
+        help="Which check to run (default: all)"
+    )
+    args = parser.parse_args()
+    
+    modes = list(CHECK_SCRIPTS) if args.mode == "all" else [args.mode]
+    exit_code = 0
+    for mode in modes:
+        exit_code = run_check(mode) or exit_code
+        print()
+    
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
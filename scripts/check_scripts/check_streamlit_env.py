@@ -3,6 +3,10 @@ import sys
 import os
 import subprocess
 import re
+import json
+import importlib.metadata
+import importlib.util
+import inspect
 from pathlib import Path
 
 # Package name mappings (pip package name -> import name)
@@ -14,19 +18,21 @@ PACKAGE_IMPORT_MAP = {
     "langchain-core": "langchain_core",
 }
 
+# Requirement line -> (package name, version specifier), compiled once
+REQUIREMENT_PATTERN = re.compile(r'^([a-zA-Z0-9\-_\.]+)(.*)$')
+
 def find_streamlit_python():
     """Find the Python interpreter that Streamlit is using."""
     try:
-        # Try to import streamlit to get its location
-        import streamlit
-        streamlit_path = streamlit.__file__
+        # Locate streamlit from its installed metadata rather than importing it
+        streamlit_path = str(importlib.metadata.distribution("streamlit").locate_file("streamlit/__init__.py"))
         
         # Get the Python executable from the current interpreter
         # (Streamlit runs in the same Python environment it's installed in)
         python_exe = sys.executable
         
         return python_exe, streamlit_path
-    except ImportError:
+    except importlib.metadata.PackageNotFoundError:
         print("Error: Streamlit is not installed in the current environment.")
         return None, None
 
@@ -47,7 +53,7 @@ def parse_requirements(requirements_path):
             
             # Parse package name and version specifier
             # Examples: "streamlit", "langchain>=1.1.3", "python-dotenv"
-            match = re.match(r'^([a-zA-Z0-9\-_\.]+)(.*)$', line)
+            match = REQUIREMENT_PATTERN.match(line)
             if match:
                 package_name = match.group(1)
                 version_spec = match.group(2).strip()
@@ -59,56 +65,73 @@ def parse_requirements(requirements_path):
     
     return requirements
 
-def check_package_in_python(python_exe, package_name, version_spec, import_name):
-    """Check if a package is installed and meets version requirements."""
-    # Check if package can be imported
-    check_import = f"import {import_name}; print('INSTALLED')"
-    
-    try:
-        result = subprocess.run(
-            [python_exe, "-c", check_import],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        
-        if result.returncode != 0 or "INSTALLED" not in result.stdout:
-            return False, None, "Not installed"
-        
-        # If version specifier exists, check version
-        if version_spec:
-            # Get installed version
-            get_version = f"import {import_name}; print(getattr({import_name}, '__version__', 'unknown'))"
-            version_result = subprocess.run(
-                [python_exe, "-c", get_version],
+def probe(packages):
+    """Probe [(package_name, import_name), ...] without importing the packages.
+
+    Versions come from the installed distribution metadata, so no package code
+    is executed. Returns {import_name: [installed, version]}.
+    """
+    results = {}
+    for package_name, import_name in packages:
+        try:
+            installed = importlib.util.find_spec(import_name) is not None
+        except (ImportError, ValueError):
+            installed = False
+        version = None
+        if installed:
+            try:
+                version = importlib.metadata.version(package_name)
+            except importlib.metadata.PackageNotFoundError:
+                pass
+        results[import_name] = [installed, version]
+    return results
+
+# Runs probe() inside another interpreter: reads the packages as JSON on stdin
+# and prints the results as JSON, so all packages are probed with a single
+# interpreter startup
+PROBE_SCRIPT = (
+    "import importlib.metadata, importlib.util, json, sys\n"
+    + inspect.getsource(probe)
+    + "print(json.dumps(probe(json.load(sys.stdin))))\n"
+)
+
+def check_packages_in_python(python_exe, requirements):
+    """Check all requirements, spawning at most one subprocess.
+
+    Streamlit runs in the interpreter it is installed in, so when python_exe is
+    the current interpreter the packages are probed in-process; another
+    interpreter is probed with a single PROBE_SCRIPT subprocess.
+
+    Returns a dict mapping package_name -> (is_installed, version, status).
+    """
+    packages = [(package_name, import_name) for package_name, _, import_name in requirements]
+    if os.path.realpath(python_exe) == os.path.realpath(sys.executable):
+        probes = probe(packages)
+    else:
+        try:
+            result = subprocess.run(
+                [python_exe, "-c", PROBE_SCRIPT],
+                input=json.dumps(packages).encode(),
                 capture_output=True,
-                text=True,
-                timeout=10
+                timeout=60
             )
-            
-            installed_version = version_result.stdout.strip() if version_result.returncode == 0 else "unknown"
-            
-            # Simple version check for >= (can be extended for other operators)
-            if version_spec.startswith(">="):
-                required_version = version_spec[2:].strip()
-                # For now, just report versions - full version comparison would need packaging library
-                return True, installed_version, f"Installed (requires {version_spec})"
-            else:
-                return True, installed_version, f"Installed (requires {version_spec})"
+            probes = json.loads(result.stdout)
+        except Exception as e:
+            return {package_name: (False, None, f"Error: {str(e)}") for package_name, _, _ in requirements}
+    
+    results = {}
+    for package_name, version_spec, import_name in requirements:
+        is_installed, version = probes.get(import_name, (False, None))
+        
+        if not is_installed:
+            results[package_name] = (False, None, "Not installed")
+        elif version_spec:
+            # For now, just report versions - full version comparison would need packaging library
+            results[package_name] = (True, version or "unknown", f"Installed (requires {version_spec})")
         else:
-            # Get version if available
-            get_version = f"import {import_name}; print(getattr({import_name}, '__version__', 'installed'))"
-            version_result = subprocess.run(
-                [python_exe, "-c", get_version],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            installed_version = version_result.stdout.strip() if version_result.returncode == 0 else "installed"
-            return True, installed_version, "Installed"
-            
-    except Exception as e:
-        return False, None, f"Error: {str(e)}"
+            results[package_name] = (True, version or "installed", "Installed")
+    
+    return results
 
 def main():
     """Main function to check if Streamlit's Python has all requirements."""
@@ -149,8 +172,10 @@ def main():
     installed_count = 0
     missing_count = 0
     
+    results = check_packages_in_python(python_exe, requirements)
+    
     for package_name, version_spec, import_name in requirements:
-        is_installed, version, status = check_package_in_python(python_exe, package_name, version_spec, import_name)
+        is_installed, version, status = results[package_name]
         
         version_display = f" (v{version})" if version and version != "installed" else ""
         requirement_display = f" {version_spec}" if version_spec else ""
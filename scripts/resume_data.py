@@ -4,54 +4,101 @@ Captures key metrics and achievements for resume inclusion
 """
 
 import os
+import re
 import sys
+import mmap
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 
+# Project paths, resolved once at import
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+REQUIREMENTS_FILE = PROJECT_ROOT / "requirements.txt"
+APP_FILE = PROJECT_ROOT / "app.py"
+
+# Directories that never contain project source (virtual envs, caches, VCS data)
+SKIP_DIRS = {".venv", "venv", "site-packages", "__pycache__", ".git", "node_modules"}
+
+def iter_python_files(root):
+    """Yield paths of .py files under root, skipping SKIP_DIRS"""
+    # scandir entries carry their file type from the listing, so no per-entry stat()
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        yield from iter_python_files(entry.path)
+                elif entry.name.endswith(".py"):
+                    yield entry.path
+    except OSError:
+        return
+
+@lru_cache(maxsize=1)
 def count_lines_of_code():
     """Count total lines of Python code in the project"""
-    project_root = Path(__file__).parent.parent
     total_lines = 0
     file_count = 0
     
-    for py_file in project_root.rglob("*.py"):
-        # Skip virtual environment files
-        if ".venv" in str(py_file) or "site-packages" in str(py_file):
-            continue
+    for py_file in iter_python_files(PROJECT_ROOT):
         try:
-            with open(py_file, 'r', encoding='utf-8') as f:
-                lines = len(f.readlines())
-                total_lines += lines
-                file_count += 1
+            # Count newlines in raw 64 KB chunks rather than decoding every line
+            lines = 0
+            chunk = b""
+            with open(py_file, 'rb') as f:
+                while block := f.read(65536):
+                    lines += block.count(b'\n')
+                    chunk = block
+            # A final line without a trailing newline still counts as a line
+            if chunk and not chunk.endswith(b'\n'):
+                lines += 1
+            total_lines += lines
+            file_count += 1
         except Exception:
             continue
     
     return total_lines, file_count
 
+# Anything after the package name: version specifier, marker or extras
+REQUIREMENT_SEPARATOR = re.compile(r"[<>=!~ ;\[]")
+
+def requirement_name(line):
+    """Extract the package name from a requirements line (before any specifier, extras or marker)"""
+    return REQUIREMENT_SEPARATOR.split(line, 1)[0]
+
+@lru_cache(maxsize=1)
 def analyze_tech_stack():
     """Analyze technologies and frameworks used"""
-    project_root = Path(__file__).parent.parent
-    requirements_file = project_root / "requirements.txt"
-    
     tech_stack = []
     try:
-        with open(requirements_file, 'r') as f:
+        with open(REQUIREMENTS_FILE, 'r') as f:
             for line in f:
                 line = line.strip()
                 if line and not line.startswith('#'):
-                    # Extract package name (before any version specifier)
-                    package = line.split('>=')[0].split('==')[0].split('<')[0].split('>')[0]
-                    tech_stack.append(package)
+                    tech_stack.append(requirement_name(line))
     except Exception:
         pass
     
     return tech_stack
 
+# (feature, markers) checked against app.py. Counters are incremented once per
+# row with a matching marker; boolean flags are set when any of their rows match.
+# has_agent_system is covered by AGENT_PATTERN below, which also matches create_agent.
+FEATURE_MARKERS = [
+    # LLM providers
+    ("llm_providers", (b"OpenAI",)),
+    ("llm_providers", (b"Ollama",)),
+    # API integrations
+    ("api_integrations", (b"TavilySearchResults", b"TAVILY_API_KEY")),
+    ("has_web_search", (b"TavilySearchResults", b"TAVILY_API_KEY")),
+    ("api_integrations", (b"OPENAI_API_KEY",)),
+    # Environment config
+    ("has_environment_config", (b"dotenv", b".envdev")),
+]
+AGENT_PATTERN = re.compile(rb"agent", re.IGNORECASE)
+
+@lru_cache(maxsize=1)
 def analyze_features():
     """Analyze key features implemented"""
-    project_root = Path(__file__).parent.parent
-    app_file = project_root / "app.py"
-    
     features = {
         "llm_providers": 0,
         "api_integrations": 0,
@@ -61,29 +108,19 @@ def analyze_features():
     }
     
     try:
-        with open(app_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # The markers are ASCII, so search the memory-mapped bytes without
+        # copying or decoding the file (mmap raises on an empty file)
+        with open(APP_FILE, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            for feature, markers in FEATURE_MARKERS:
+                if any(content.find(marker) != -1 for marker in markers):
+                    if isinstance(features[feature], bool):
+                        features[feature] = True
+                    else:
+                        features[feature] += 1
             
-            # Count LLM providers
-            if "OpenAI" in content:
-                features["llm_providers"] += 1
-            if "Ollama" in content:
-                features["llm_providers"] += 1
-            
-            # Check for API integrations
-            if "TavilySearchResults" in content or "TAVILY_API_KEY" in content:
-                features["api_integrations"] += 1
-                features["has_web_search"] = True
-            if "OPENAI_API_KEY" in content:
-                features["api_integrations"] += 1
-            
-            # Check for agent system
-            if "create_agent" in content or "agent" in content.lower():
+            # Any mention of an agent, in any case, counts as an agent system
+            if AGENT_PATTERN.search(content):
                 features["has_agent_system"] = True
-            
-            # Check for environment config
-            if "dotenv" in content or ".envdev" in content:
-                features["has_environment_config"] = True
                 
     except Exception:
         pass
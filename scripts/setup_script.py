@@ -14,6 +14,8 @@ Usage:
 
 import os
 import sys
+import json
+import shutil
 import subprocess
 import platform
 from pathlib import Path
@@ -26,6 +28,30 @@ VENV_NAME = ".venv"
 REQUIREMENTS_FILE = "requirements.txt"
 ENV_FILE = ".envdev"
 
+# Template written to ENV_FILE when it does not exist yet
+ENV_TEMPLATE = """# Environment variables for Due Diligence Agent
+# Copy this file or rename to .envdev and fill in your API keys
+
+# ==============================================================================
+# REQUIRED: Tavily API Key (for web search)
+# Get your key at: https://tavily.com/
+# ==============================================================================
+TAVILY_API_KEY=your_tavily_api_key_here
+
+# ==============================================================================
+# OPTIONAL: OpenAI API Key (only if using OpenAI as LLM provider)
+# Get your key at: https://platform.openai.com/api-keys
+# ==============================================================================
+OPENAI_API_KEY=your_openai_api_key_here
+
+# ==============================================================================
+# OPTIONAL: Ollama Configuration (for local LLM)
+# Download Ollama at: https://ollama.com/
+# ==============================================================================
+OLLAMA_MODEL=llama3.2
+OLLAMA_BASE_URL=http://localhost:11434
+"""
+
 # Get the project root (parent of scripts folder)
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -63,13 +89,12 @@ def print_error(text: str) -> None:
 
 
 def run_command(cmd: list, cwd: Path = None, capture_output: bool = False) -> subprocess.CompletedProcess:
-    """Run a shell command and return the result."""
+    """Run a shell command and return the result (captured output is bytes)."""
     try:
         result = subprocess.run(
             cmd,
             cwd=cwd or PROJECT_ROOT,
             capture_output=capture_output,
-            text=True,
             check=False
         )
         return result
@@ -107,8 +132,9 @@ def create_virtual_environment() -> bool:
         print_success(f"Virtual environment already exists at: {venv_path}")
         return True
     
-    print(f"  Creating virtual environment at: {venv_path}")
-    result = run_command([sys.executable, "-m", "venv", str(venv_path)])
+    creator = get_venv_creator()
+    print(f"  Creating virtual environment at: {venv_path} (using {creator[0]})")
+    result = run_command(creator + [str(venv_path)])
     
     if result and result.returncode == 0:
         print_success("Virtual environment created successfully")
@@ -118,6 +144,17 @@ def create_virtual_environment() -> bool:
         return False
 
 
+def get_venv_creator() -> list:
+    """Get the fastest available command for creating a virtual environment."""
+    # uv and virtualenv are much faster than "python -m venv", which bootstraps
+    # pip via ensurepip. All three are pinned to the interpreter running setup.
+    if shutil.which("uv"):
+        return ["uv", "venv", "--python", sys.executable]
+    if shutil.which("virtualenv"):
+        return ["virtualenv", "--python", sys.executable]
+    return [sys.executable, "-m", "venv"]
+
+
 def get_venv_python() -> Path:
     """Get the path to the Python executable in the virtual environment."""
     venv_path = PROJECT_ROOT / VENV_NAME
@@ -148,19 +185,30 @@ def install_requirements() -> bool:
         print_error(f"Requirements file not found: {requirements_path}")
         return False
     
-    pip_path = get_venv_pip()
-    
-    if not pip_path.exists():
-        print_error(f"Pip not found at: {pip_path}")
-        return False
-    
-    # Upgrade pip first
-    print("  Upgrading pip...")
-    run_command([str(pip_path), "install", "--upgrade", "pip"])
-    
-    # Install requirements
-    print(f"  Installing packages from {REQUIREMENTS_FILE}...")
-    result = run_command([str(pip_path), "install", "-r", str(requirements_path)])
+    if shutil.which("uv"):
+        # uv installs into the venv directly (venvs created by uv have no pip)
+        print(f"  Installing packages from {REQUIREMENTS_FILE} with uv...")
+        result = run_command([
+            "uv", "pip", "install",
+            "--python", str(get_venv_python()),
+            "-r", str(requirements_path),
+        ])
+    else:
+        pip_path = get_venv_pip()
+        
+        if not pip_path.exists():
+            print_error(f"Pip not found at: {pip_path}")
+            return False
+        
+        # Upgrade pip and install requirements in a single pip run. This goes through
+        # "python -m pip" because pip.exe cannot replace itself on Windows.
+        print(f"  Upgrading pip and installing packages from {REQUIREMENTS_FILE}...")
+        result = run_command([
+            str(get_venv_python()), "-m", "pip", "install",
+            "--disable-pip-version-check",
+            "--upgrade", "pip",
+            "-r", str(requirements_path),
+        ])
     
     if result and result.returncode == 0:
         print_success("All dependencies installed successfully")
@@ -181,32 +229,8 @@ def create_env_file() -> bool:
         print_warning("Review the file and add your API keys if not already set")
         return True
     
-    env_template = """# Environment variables for Due Diligence Agent
-# Copy this file or rename to .envdev and fill in your API keys
-
-# ==============================================================================
-# REQUIRED: Tavily API Key (for web search)
-# Get your key at: https://tavily.com/
-# ==============================================================================
-TAVILY_API_KEY=your_tavily_api_key_here
-
-# ==============================================================================
-# OPTIONAL: OpenAI API Key (only if using OpenAI as LLM provider)
-# Get your key at: https://platform.openai.com/api-keys
-# ==============================================================================
-OPENAI_API_KEY=your_openai_api_key_here
-
-# ==============================================================================
-# OPTIONAL: Ollama Configuration (for local LLM)
-# Download Ollama at: https://ollama.com/
-# ==============================================================================
-OLLAMA_MODEL=llama3.2
-OLLAMA_BASE_URL=http://localhost:11434
-"""
-    
     try:
-        with open(env_path, "w") as f:
-            f.write(env_template)
+        env_path.write_text(ENV_TEMPLATE, encoding="utf-8")
         print_success(f"Created environment template file: {env_path}")
         print_warning("IMPORTANT: Edit .envdev and add your API keys before running the app")
         return True
@@ -230,13 +254,21 @@ def verify_installation() -> bool:
         "dotenv",
     ]
     
+    # Probe every package with one venv interpreter launch instead of one per package
+    probe = (
+        "import importlib.util, json; "
+        f"print(json.dumps({{m: importlib.util.find_spec(m) is not None for m in {packages_to_check!r}}}))"
+    )
+    result = run_command([str(python_path), "-c", probe], capture_output=True)
+    
+    try:
+        found = json.loads(result.stdout) if result and result.returncode == 0 else {}
+    except ValueError:
+        found = {}
+    
     all_ok = True
     for package in packages_to_check:
-        result = run_command(
-            [str(python_path), "-c", f"import {package}"],
-            capture_output=True
-        )
-        if result and result.returncode == 0:
+        if found.get(package):
             print_success(f"{package} - installed")
         else:
             print_error(f"{package} - NOT FOUND")
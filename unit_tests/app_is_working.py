@@ -10,25 +10,55 @@ Run:
 
 import os
 import sys
+import json
+import hashlib
+import argparse
+import socket
+import http.client
 import time
+import functools
 import importlib
-from typing import List, Tuple
-from urllib.request import urlopen, Request
-from urllib.error import URLError
+import importlib.util
+from pathlib import Path
+from typing import List, Optional, Tuple
+from urllib.parse import urlsplit
 
 OK = "OK"
 WARN = "WARN"
 FAIL = "FAIL"
+SKIP = "SKIP"
 
+_ICONS = {OK: "✓", WARN: "⚠", FAIL: "✗", SKIP: "↷"}
 
-def _print_result(name: str, status: str, detail: str = "") -> None:
-    icon = {OK: "✓", WARN: "⚠", FAIL: "✗"}.get(status, "•")
+EXPECTED_ENV_VARS = ["OPENAI_API_KEY", "TAVILY_API_KEY"]
+
+REQUIREMENTS_FILE = Path(__file__).resolve().parent.parent / "requirements.txt"
+
+# Environment check results of a clean run are reused while the fingerprint matches
+CACHE_FILE = Path.home() / ".cache" / "due-diligence-agent" / "healthcheck.json"
+CACHE_TTL_SECONDS = 10 * 60
+
+# Connect and request timeout for the Ollama server check
+OLLAMA_TIMEOUT_SECONDS = 3
+
+# Packages the app needs at startup, as (import name, pip name)
+REQUIRED_PACKAGES = (
+    ("streamlit", "streamlit"),
+    ("dotenv", "python-dotenv"),
+    ("langchain_core", "langchain-core"),
+    ("langchain_community", "langchain-community"),
+)
+
+
+def _format_result(name: str, status: str, detail: str = "") -> str:
+    icon = _ICONS.get(status, "•")
     msg = f"{icon} {name}: {status}"
     if detail:
         msg += f" — {detail}"
-    print(msg)
+    return msg
 
 
+@functools.lru_cache(maxsize=1)
 def check_python_version(min_major: int = 3, min_minor: int = 10) -> Tuple[str, str]:
     v = sys.version_info
     if (v.major, v.minor) >= (min_major, min_minor):
@@ -36,64 +66,131 @@ def check_python_version(min_major: int = 3, min_minor: int = 10) -> Tuple[str,
     return FAIL, f"Found {v.major}.{v.minor}, require >= {min_major}.{min_minor}"
 
 
-def check_requirements_installed(packages: List[str]) -> Tuple[str, str]:
-    missing = []
-    for pkg in packages:
-        try:
-            importlib.import_module(pkg)
-        except Exception:
-            missing.append(pkg)
+@functools.lru_cache(maxsize=128)
+def _probe_import(name: str) -> Optional[Exception]:
+    """Import a module once and remember the failure (None on success)."""
+    try:
+        importlib.import_module(name)
+        return None
+    except Exception as e:
+        return e
+
+
+def _is_installed(name: str) -> bool:
+    """Check that a module can be found without executing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        # A missing parent package raises instead of returning None
+        return False
+
+
+@functools.lru_cache(maxsize=16)
+def check_requirements_installed(
+    packages: Tuple[Tuple[str, str], ...] = REQUIRED_PACKAGES,
+) -> Tuple[str, str]:
+    # Availability only; the import checks below do the real (heavier) imports
+    missing = [(name, pip_name) for name, pip_name in packages if not _is_installed(name)]
     if not missing:
-        return OK, "All required packages import successfully"
-    return FAIL, f"Missing packages: {', '.join(missing)}"
+        return OK, "All required packages are installed"
+    names = ", ".join(name for name, _ in missing)
+    pip_names = " ".join(pip_name for _, pip_name in missing)
+    return FAIL, f"Missing packages: {names} (pip install {pip_names})"
 
 
 def check_env_vars(vars_to_check: List[str]) -> Tuple[str, str]:
-    missing = [v for v in vars_to_check if not os.getenv(v)]
+    if not vars_to_check:
+        return OK, "No env vars to check"
+    # One dict lookup per name keeps the missing list in the caller's order
+    environ = os.environ
+    missing = [v for v in vars_to_check if not environ.get(v)]
     if not missing:
         return OK, "All expected env vars present"
     return WARN, f"Missing env vars: {', '.join(missing)}"
 
 
 def check_streamlit_import() -> Tuple[str, str]:
-    try:
-        import streamlit  # noqa: F401
+    error = _probe_import("streamlit")
+    if error is None:
         return OK, "streamlit import succeeded"
-    except Exception as e:
-        return FAIL, f"streamlit import failed: {e}"
+    return FAIL, f"streamlit import failed: {error}"
 
 
 def check_langchain_imports() -> Tuple[str, str]:
+    # Really import (find_spec alone is the Requirements check), so a broken
+    # LangChain install is caught here
+    for name in ("langchain_core", "langchain_community"):
+        error = _probe_import(name)
+        if error is not None:
+            return FAIL, f"LangChain imports failed: {error}"
+    # Optional providers
+    optional_missing = [
+        name for name in ("langchain_openai", "langchain_ollama")
+        if _probe_import(name) is not None
+    ]
+    if optional_missing:
+        return WARN, f"Optional providers missing: {', '.join(optional_missing)}"
+    return OK, "LangChain core + providers import succeeded"
+
+
+def _connect_error(host: str, port: int, timeout: float = OLLAMA_TIMEOUT_SECONDS) -> Optional[str]:
+    """TCP reachability probe: why host:port can't be reached, or None if it can.
+
+    A refused connection fails immediately; only a slow or silent host waits
+    for the timeout.
+    """
     try:
-        import langchain_core  # noqa: F401
-        import langchain_community  # noqa: F401
-        # Optional providers
-        optional_missing = []
-        try:
-            import langchain_openai  # noqa: F401
-        except Exception:
-            optional_missing.append("langchain_openai")
-        try:
-            import langchain_ollama  # noqa: F401
-        except Exception:
-            optional_missing.append("langchain_ollama")
-        if optional_missing:
-            return WARN, f"Optional providers missing: {', '.join(optional_missing)}"
-        return OK, "LangChain core + providers import succeeded"
-    except Exception as e:
-        return FAIL, f"LangChain imports failed: {e}"
+        with socket.create_connection((host, port), timeout=timeout):
+            return None
+    except ConnectionRefusedError:
+        return f"nothing listening on {host}:{port}"
+    except socket.timeout:
+        return f"timed out after {timeout}s connecting to {host}:{port}"
+    except OSError as e:
+        return f"cannot connect to {host}:{port}: {e}"
+
+
+def _http_status(parts, method: str, path: str, headers: dict) -> int:
+    """Send one request with http.client and return only the response status."""
+    conn_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    conn = conn_cls(parts.hostname, parts.port, timeout=OLLAMA_TIMEOUT_SECONDS)
+    try:
+        conn.request(method, path, headers=headers)
+        return conn.getresponse().status
+    finally:
+        conn.close()
 
 
 def check_ollama_server(base_url: str = None) -> Tuple[str, str]:
+    # Without an explicit URL or env setting, Ollama is optional
+    configured = bool(base_url or os.getenv("OLLAMA_BASE_URL"))
     base_url = base_url or os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
     try:
-        req = Request(f"{base_url}/api/tags", headers={"Accept": "application/json"})
-        with urlopen(req, timeout=3) as resp:
-            if resp.status == 200:
-                return OK, f"Ollama reachable at {base_url}"
-            return WARN, f"Ollama responded with status {resp.status}"
-    except URLError as e:
-        return WARN, f"Ollama not reachable at {base_url}: {e.reason}"
+        parts = urlsplit(base_url)
+        if not parts.hostname:
+            return WARN, f"Ollama check error: invalid base URL {base_url!r}"
+
+        # Skip the HTTP request when the port can't be reached
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        error = _connect_error(parts.hostname, port)
+        if error is not None:
+            if not configured:
+                return SKIP, "Ollama not configured and nothing reachable on the default port"
+            return WARN, f"Ollama not reachable at {base_url}: {error}"
+
+        # Only the status matters, so ask for headers only and skip the model list
+        path = f"{parts.path.rstrip('/')}/api/tags"
+        headers = {"Accept": "application/json", "Connection": "close"}
+        status = _http_status(parts, "HEAD", path, headers)
+        if status in (404, 405, 501):
+            # Server has no HEAD route here; fetch a single byte instead
+            status = _http_status(parts, "GET", path, {**headers, "Range": "bytes=0-0"})
+
+        if status in (200, 206):
+            return OK, f"Ollama reachable at {base_url}"
+        return WARN, f"Ollama responded with status {status}"
+    except OSError as e:
+        return WARN, f"Ollama not reachable at {base_url}: {e}"
     except Exception as e:
         return WARN, f"Ollama check error: {e}"
 
@@ -102,27 +199,52 @@ def check_ollama_server(base_url: str = None) -> Tuple[str, str]:
 class DummyLLM:
     """A minimal stand-in for an LLM that echoes input size."""
 
+    __slots__ = ("temperature",)
+
     def __init__(self):
         self.temperature = 0
 
     def invoke(self, payload):
-        text = str(payload)
+        # Size the values directly instead of building the payload's repr
+        if isinstance(payload, (str, bytes, bytearray)):
+            size = len(payload)
+        elif isinstance(payload, dict):
+            size = sum(len(v) if isinstance(v, (str, bytes, bytearray)) else len(str(v)) for v in payload.values())
+        else:
+            size = len(str(payload))
         return {
             "messages": [
-                {"type": "ai", "content": f"len={len(text)}"}
+                {"type": "ai", "content": f"len={size}"}
             ]
         }
 
 
-def stress_long_inputs(iterations: int = 3, size: int = 100_000) -> Tuple[str, str]:
-    llm = DummyLLM()
+# DummyLLM is stateless, so both stress tests share one instance, and the
+# default long prompt is built once at import (as bytes, which skip the str
+# header and hash slot).
+_SHARED_LLM = DummyLLM()
+_LONG_PROMPT_SIZE = 100_000
+_LONG_PROMPT = bytearray(b"A" * _LONG_PROMPT_SIZE)
+
+
+def stress_long_inputs(iterations: int = 3, size: int = _LONG_PROMPT_SIZE) -> Tuple[str, str]:
+    llm = _SHARED_LLM
+    # The stress tests run one after the other, so the default prompt is used in
+    # place: a tail wide enough for the largest index is appended, rewritten per
+    # iteration (the buffer never changes size) and trimmed again afterwards.
+    width = len(str(max(iterations - 1, 0)))
     try:
-        for i in range(iterations):
-            s = ("A" * size) + str(i)
-            res = llm.invoke({"prompt": s})
-            if "messages" not in res:
-                return FAIL, "DummyLLM returned unexpected structure"
-        return OK, f"Processed {iterations} long inputs of ~{size} chars"
+        buf = _LONG_PROMPT if size == _LONG_PROMPT_SIZE else bytearray(b"A" * size)
+        buf += b" " * width
+        try:
+            for i in range(iterations):
+                buf[-width:] = b"%*d" % (width, i)
+                res = llm.invoke({"prompt": buf})
+                if "messages" not in res:
+                    return FAIL, "DummyLLM returned unexpected structure"
+        finally:
+            del buf[-width:]
+        return OK, f"Processed {iterations} long inputs of ~{size} bytes"
     except MemoryError:
         return FAIL, "MemoryError during long input stress"
     except Exception as e:
@@ -130,60 +252,178 @@ def stress_long_inputs(iterations: int = 3, size: int = 100_000) -> Tuple[str, s
 
 
 def stress_repeat_calls(iterations: int = 1000) -> Tuple[str, str]:
-    llm = DummyLLM()
+    llm = _SHARED_LLM
+    # Reuse one payload so the loop times invoke() rather than dict/f-string allocation
+    payload = {"prompt": "ping"}
     try:
-        start = time.time()
-        for i in range(iterations):
-            _ = llm.invoke({"prompt": f"ping {i}"})
-        dur = time.time() - start
+        start = time.perf_counter()
+        for _ in range(iterations):
+            llm.invoke(payload)
+        dur = time.perf_counter() - start
         return OK, f"{iterations} calls completed in {dur:.2f}s"
     except Exception as e:
         return FAIL, f"Error during repeat calls stress: {e}"
 
 
-def main() -> int:
-    checks = []
-
-    # Core environment
-    checks.append(("Python Version", *check_python_version()))
-    checks.append(("Requirements", *check_requirements_installed([
-        "streamlit",
-        "dotenv",
-        "langchain_core",
-        "langchain_community",
-    ])))
+def run_environment_checks() -> List[Tuple[str, str, str]]:
+    # Each check is (name, fn, depends_on). Checks run one at a time in
+    # dependency order; a check whose dependency failed or was skipped is
+    # reported as SKIP without running. Results keep this order.
+    check_fns = [
+        # Core environment
+        ("Python Version", check_python_version, ()),
+        ("Requirements", check_requirements_installed, ()),
+
+        # Secrets presence (optional; WARN if missing)
+        ("Env Vars", lambda: check_env_vars(EXPECTED_ENV_VARS), ()),
+
+        # Imports
+        ("Streamlit Import", check_streamlit_import, ("Requirements",)),
+        ("LangChain Imports", check_langchain_imports, ("Requirements",)),
+    ]
+
+    # An unknown dependency would never resolve, so reject it before scheduling
+    names = {name for name, _, _ in check_fns}
+    for name, _, depends_on in check_fns:
+        unknown = [dep for dep in depends_on if dep not in names]
+        if unknown:
+            raise ValueError(f"Check {name!r} depends on unknown checks: {', '.join(unknown)}")
+
+    # Topological order: repeatedly take the checks whose dependencies are all
+    # placed, keeping the listed order among them
+    ordered = []
+    placed = set()
+    remaining = list(check_fns)
+    while remaining:
+        ready = [check for check in remaining if all(dep in placed for dep in check[2])]
+        if not ready:
+            raise ValueError(f"Dependency cycle among checks: {', '.join(name for name, _, _ in remaining)}")
+        ordered += ready
+        placed.update(name for name, _, _ in ready)
+        remaining = [check for check in remaining if check[0] not in placed]
+
+    results = {}
+    for name, fn, depends_on in ordered:
+        blocked = [dep for dep in depends_on if results[dep][0] in (FAIL, SKIP)]
+        results[name] = (SKIP, f"depends on {', '.join(blocked)}") if blocked else fn()
+
+    return [(name, *results[name]) for name, _, _ in check_fns]
+
+
+def run_live_checks() -> List[Tuple[str, str, str]]:
+    # Service state and timings change from run to run, so these are never
+    # cached. They run after the environment checks, so the stress timings do
+    # not include the cold imports.
+    check_fns = [
+        # Local services
+        ("Ollama Server", check_ollama_server),
+
+        # Stress (local-only)
+        ("Stress Long Inputs", stress_long_inputs),
+        ("Stress Repeat Calls", stress_repeat_calls),
+    ]
+    return [(name, *fn()) for name, fn in check_fns]
+
+
+def run_checks() -> List[Tuple[str, str, str]]:
+    return run_environment_checks() + run_live_checks()
+
+
+def _mtime(path) -> Optional[float]:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
 
-    # Secrets presence (optional; WARN if missing)
-    checks.append(("Env Vars", *check_env_vars([
-        "OPENAI_API_KEY",
-        "TAVILY_API_KEY",
-    ])))
 
-    # Imports
-    checks.append(("Streamlit Import", *check_streamlit_import()))
-    checks.append(("LangChain Imports", *check_langchain_imports()))
+def _environment_fingerprint() -> str:
+    """Hash of everything the environment checks depend on that can change between runs.
 
-    # Local services
-    checks.append(("Ollama Server", *check_ollama_server()))
+    sys.path directory mtimes change whenever packages are (un)installed. Only
+    the names of set env vars are included, never their values.
+    """
+    state = {
+        "python": sys.version,
+        "executable": sys.executable,
+        "path": [(p, _mtime(p)) for p in sys.path],
+        "requirements": _mtime(REQUIREMENTS_FILE),
+        "env": [name for name in EXPECTED_ENV_VARS if os.environ.get(name)],
+    }
+    return hashlib.sha256(json.dumps(state, sort_keys=True).encode()).hexdigest()
 
-    # Stress (local-only)
-    checks.append(("Stress Long Inputs", *stress_long_inputs()))
-    checks.append(("Stress Repeat Calls", *stress_repeat_calls()))
 
-    # Print results
+def _load_cached_checks(fingerprint: str) -> Optional[List[Tuple[str, str, str]]]:
+    try:
+        data = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    # Anything not shaped like a file _save_cached_checks wrote is ignored
+    if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+        return None
+    timestamp = data.get("timestamp")
+    if not isinstance(timestamp, (int, float)) or time.time() - timestamp > CACHE_TTL_SECONDS:
+        return None
+    checks = data.get("checks")
+    if not isinstance(checks, list) or not all(
+        isinstance(check, list) and len(check) == 3 and all(isinstance(field, str) for field in check)
+        for check in checks
+    ):
+        return None
+    return [tuple(check) for check in checks]
+
+
+def _save_cached_checks(fingerprint: str, checks: List[Tuple[str, str, str]]) -> None:
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_FILE.write_text(
+            json.dumps({"fingerprint": fingerprint, "timestamp": time.time(), "checks": checks}),
+            encoding="utf-8",
+        )
+    except OSError:
+        pass
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Pre-run health checks")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached environment checks and re-run them")
+    args = parser.parse_args(argv)
+
+    # Reuse recent clean environment checks when the fingerprint is unchanged;
+    # the live checks always run
+    fingerprint = _environment_fingerprint()
+    checks = None if args.no_cache else _load_cached_checks(fingerprint)
+    cached = checks is not None
+    if not cached:
+        checks = run_environment_checks()
+        # Failing runs are never cached, so a fix is always re-verified
+        if all(status != FAIL for _, status, _ in checks):
+            _save_cached_checks(fingerprint, checks)
+    checks += run_live_checks()
+
+    # Print results (built up and written once)
     failures = 0
     warnings = 0
-    print("\n=== Pre-run Health Check ===")
+    skipped = 0
+    lines = ["", "=== Pre-run Health Check ==="]
+    if cached:
+        lines.append(f"(environment checks cached from the last {CACHE_TTL_SECONDS // 60} minutes; use --no-cache to re-run)")
     for name, status, detail in checks:
-        _print_result(name, status, detail)
+        lines.append(_format_result(name, status, detail))
         if status == FAIL:
             failures += 1
         elif status == WARN:
             warnings += 1
-
-    print("\nSummary:")
-    print(f"Failures: {failures}")
-    print(f"Warnings: {warnings}")
+        elif status == SKIP:
+            skipped += 1
+
+    lines += [
+        "",
+        "Summary:",
+        f"Failures: {failures}",
+        f"Warnings: {warnings}",
+        f"Skipped: {skipped}",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
     # Return non-zero on failure to integrate with CI
     return 1 if failures > 0 else 0